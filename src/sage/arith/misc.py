@@ -3185,18 +3185,35 @@ def crt(a, b, m=None, n=None):
         58
         sage: crt(mpz(2), 3, mpz(7), numpy.int8(11))
         58
+
+    TESTS:
+
+    Equal residues do not require an extended gcd::
+
+        sage: crt(5, 5, 7, 11)
+        5
+        sage: crt(2, 2, 6, 8)
+        2
     """
     if isinstance(a, list):
         return CRT_list(a, b)
 
     try:
-        f = (b-a).quo_rem
+        d = b - a
+        f = d.quo_rem
     except (TypeError, AttributeError):
         # Maybe there is no coercion between a and b.
         # Maybe (b-a) does not have a quo_rem attribute
         a = py_scalar_to_element(a)
         b = py_scalar_to_element(b)
-        f = (b-a).quo_rem
+        d = b - a
+        f = d.quo_rem
+
+    if not d:
+        # The two congruences agree, so a itself is a solution and the
+        # extended gcd of the moduli can be skipped entirely.
+        from sage.arith.functions import lcm
+        return a % lcm(m, n)
 
     g, alpha, beta = XGCD(m, n)
     q, r = f(g)
@@ -3334,8 +3351,16 @@ def CRT_basis(moduli):
     n = len(moduli)
     if n == 0:
         return []
+    moduli = [py_scalar_to_element(m) for m in moduli]
     M = prod(moduli)
-    return [((xgcd(m,M//m)[2])*(M//m))%M for m in moduli]
+    cs = []
+    for m in moduli:
+        Mm = M // m
+        # Only the inverse of M/m modulo m is needed, so a half
+        # extended gcd suffices; this skips computing the unused
+        # Bezout coefficient that a full xgcd would produce.
+        cs.append((Mm.inverse_mod(m) * Mm) % M)
+    return cs
 
 
 def CRT_vectors(X, moduli):
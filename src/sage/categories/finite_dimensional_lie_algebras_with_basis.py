@@ -117,19 +117,17 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
             d = F.gens_dict()
             rels = {}
             S = self.structure_coefficients(True)
-            # Construct the map from indices to names of the UEA
-
-            def get_var(g):
-                return d[names_map(g)]
-            # The function ``get_var`` sends an element of the basis of
-            # ``self`` to the corresponding element of ``F``.
+            # Map each basis index of ``self`` to the corresponding
+            # generator of ``F`` once, instead of resolving the name on
+            # every structure-coefficient term.
+            var_of = {g: d[names_map(g)] for g in I}
             for k in S.keys():
-                g0 = get_var(k[0])
-                g1 = get_var(k[1])
+                g0 = var_of[k[0]]
+                g1 = var_of[k[1]]
                 if g0 < g1:
-                    rels[g1*g0] = g0*g1 - F.sum(val*get_var(g) for g, val in S[k])
+                    rels[g1*g0] = g0*g1 - F.sum(val*var_of[g] for g, val in S[k])
                 else:
-                    rels[g0*g1] = g1*g0 + F.sum(val*get_var(g) for g, val in S[k])
+                    rels[g0*g1] = g1*g0 + F.sum(val*var_of[g] for g, val in S[k])
             try:
                 return F.g_algebra(rels)
             except RuntimeError:
@@ -248,6 +246,56 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
             B = self.basis()
             return self.sum(v[i] * B[k] for i,k in enumerate(order) if v[i] != 0)
 
+        @cached_method
+        def _basis_adjoint_matrices(self):
+            r"""
+            Return the adjoint matrices of the basis elements of ``self``.
+
+            The matrices are computed once and cached, since methods
+            such as :meth:`killing_form_matrix` and
+            :meth:`ElementMethods.adjoint_matrix` reuse them repeatedly.
+
+            EXAMPLES::
+
+                sage: L.<x,y> = LieAlgebra(QQ, {('x','y'):{'x':1}})
+                sage: L._basis_adjoint_matrices()[0]
+                [0 0]
+                [1 0]
+                sage: all(m.is_immutable() for m in L._basis_adjoint_matrices())
+                True
+            """
+            basis = list(self.basis())
+            mats = tuple(matrix(self.base_ring(),
+                                [self.bracket(b, c).to_vector() for c in basis])
+                         for b in basis)
+            for m in mats:
+                m.set_immutable()
+            return mats
+
+        @cached_method
+        def _structure_coefficient_vectors(self):
+            r"""
+            Return the coordinate vectors of the structure coefficients
+            of ``self``, keyed by pairs of basis indices and including
+            both orientations of each nonzero bracket.
+
+            EXAMPLES::
+
+                sage: L.<x,y> = LieAlgebra(QQ, {('x','y'):{'x':1}})
+                sage: sorted(L._structure_coefficient_vectors().items())
+                [(('x', 'y'), (1, 0)), (('y', 'x'), (-1, 0))]
+            """
+            sc = {}
+            S = self.structure_coefficients()
+            for k in S.keys():
+                v = S[k].to_vector()
+                mv = -v
+                v.set_immutable()
+                mv.set_immutable()
+                sc[k] = v
+                sc[k[1], k[0]] = mv
+            return sc
+
         def killing_matrix(self, x, y):
             r"""
             Return the Killing matrix of ``x`` and ``y``, where ``x``
@@ -296,7 +344,14 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 sage: L.killing_form(a, b)
                 0
             """
-            return self.killing_matrix(x, y).trace()
+            # Use the identity tr(AB) = sum_{i,j} A[i,j] * B[j,i] to
+            # avoid forming the full matrix product, of which only the
+            # diagonal would be kept.
+            A = x.adjoint_matrix()
+            B = y.adjoint_matrix()
+            n = A.nrows()
+            return self.base_ring().sum(A[i, j] * B[j, i]
+                                        for i in range(n) for j in range(n))
 
         @cached_method
         def killing_form_matrix(self):
@@ -321,9 +376,19 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 sage: parent(m)
                 Full MatrixSpace of 0 by 0 dense matrices over Rational Field
             """
-            B = self.basis()
-            m = matrix(self.base_ring(),
-                       [[self.killing_form(x, y) for x in B] for y in B])
+            R = self.base_ring()
+            ads = self._basis_adjoint_matrices()
+            # The (a, b) entry is tr(ad_a ad_b) = sum_{i,j} ad_a[i,j] *
+            # ad_b[j,i], which is the dot product of ad_a flattened
+            # row-wise with ad_b flattened column-wise. One matrix
+            # product therefore yields all n^2 traces at once, instead
+            # of recomputing the adjoint matrices pairwise.
+            if not ads:
+                m = matrix(R, 0, 0)
+            else:
+                V = matrix(R, [A.list() for A in ads])
+                W = matrix(R, [A.transpose().list() for A in ads])
+                m = V * W.transpose()
             m.set_immutable()
             return m
 
@@ -371,14 +436,16 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
             B = self.basis()
             K = list(B.keys())
             zero = self.zero()
+            basis_key = self._basis_key
             for i, x in enumerate(K):
-                for y in K[i + 1:]:
-                    bx = B[x]
-                    by = B[y]
-                    val = self.bracket(bx, by)
+                bx = B[x]
+                kx = basis_key(x)
+                for j in range(i + 1, len(K)):
+                    y = K[j]
+                    val = self.bracket(bx, B[y])
                     if not include_zeros and val == zero:
                         continue
-                    if self._basis_key(x) > self._basis_key(y):
+                    if kx > basis_key(y):
                         d[y,x] = -val
                     else:
                         d[x,y] = val
@@ -430,19 +497,25 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
             else:
                 m = self.subalgebra(S).basis_matrix()
 
-            S = self.structure_coefficients()
-            sc = {}
-            for k in S.keys():
-                v = S[k].to_vector()
-                sc[k] = v
-                sc[k[1],k[0]] = -v
+            sc = self._structure_coefficient_vectors()
             X = self.basis().keys()
             d = len(X)
-            c_mat = matrix(self.base_ring(),
-                           [[sum(m[i,j] * sc[x,xp][k] for j,xp in enumerate(X)
-                                 if (x, xp) in sc)
-                             for x in X]
-                            for i in range(d) for k in range(d)])
+            R = self.base_ring()
+            zero_row = [R.zero()] * d
+            # Column x of the constraint matrix holds the entries of
+            # m * S_x, where row xp of S_x gives the coordinates of
+            # [b_x, b_xp]. Assembling the columns this way replaces the
+            # former Python triple loop with one matrix product per
+            # basis index, performed at the base ring's native speed.
+            cols = []
+            for x in X:
+                Sx = matrix(R, [sc[x, xp] if (x, xp) in sc else zero_row
+                                for xp in X])
+                cols.append((m * Sx).list())
+            if cols:
+                c_mat = matrix(R, cols).transpose()
+            else:
+                c_mat = matrix(R, 0, 0)
             C = c_mat.right_kernel().basis_matrix()
             return [self.from_vector(c) for c in C]
 
@@ -806,15 +879,28 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
             else:
                 A = self
 
-            if L not in self.category():
-                # L might be a submodule of A.module()
-                LB = [self.from_vector(b) for b in L.basis()]
+            if L is self and A is self:
+                # [self, self] is spanned by the brackets of basis
+                # elements with i < j, which are exactly the cached
+                # structure coefficients; this skips recomputing all
+                # n^2 brackets (including the zero diagonal and the
+                # redundant transposed pairs).
+                S = self.structure_coefficients()
+                rows = [S[k].to_vector() for k in S.keys()]
+                if rows:
+                    b_mat = matrix(A.base_ring(), rows)
+                else:
+                    b_mat = matrix(A.base_ring(), 0, self.dimension())
             else:
-                LB = L.basis()
+                if L not in self.category():
+                    # L might be a submodule of A.module()
+                    LB = [self.from_vector(b) for b in L.basis()]
+                else:
+                    LB = L.basis()
 
-            B = self.basis()
-            b_mat = matrix(A.base_ring(), [A.bracket(b, lb).to_vector()
-                                           for b in B for lb in LB])
+                B = self.basis()
+                b_mat = matrix(A.base_ring(), [A.bracket(b, lb).to_vector()
+                                               for b in B for lb in LB])
             if submodule is True or not (self.is_ideal(A) and L.is_ideal(A)):
                 return b_mat.row_space()
             # We echelonize the matrix here
@@ -902,11 +988,14 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 ())
             """
             L = [self]
-            while L[-1].dimension() > 0:
+            dim = self.dimension()
+            while dim > 0:
                 p = L[-1].derived_subalgebra()
-                if L[-1].dimension() == p.dimension():
+                pdim = p.dimension()
+                if dim == pdim:
                     break
                 L.append(p)
+                dim = pdim
             return tuple(L)
 
         @cached_method
@@ -970,11 +1059,14 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 L = [self.module()]
             else:
                 L = [self]
-            while L[-1].dimension() > 0:
+            dim = L[-1].dimension()
+            while dim > 0:
                 s = self.product_space(L[-1], submodule = submodule)
-                if L[-1].dimension() == s.dimension():
+                sdim = s.dimension()
+                if dim == sdim:
                     break
                 L.append(s)
+                dim = sdim
             return tuple(L)
 
         def is_abelian(self):
@@ -993,9 +1085,23 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 sage: L.is_abelian()
                 False
             """
-            return len(self.structure_coefficients()) == 0
-            # TODO: boolean handling of empty family
-            #return not self.structure_coefficients()
+            # Parents may override structure_coefficients with a plain
+            # method, in which case there is no cache to probe.
+            sc = self.structure_coefficients
+            if getattr(sc, 'is_in_cache', None) is not None and sc.is_in_cache():
+                return len(sc()) == 0
+            # Probe the brackets directly so that the first nonzero one
+            # answers the question, instead of forcing the computation
+            # of all structure coefficients.
+            B = self.basis()
+            K = list(B.keys())
+            zero = self.zero()
+            for i, x in enumerate(K):
+                bx = B[x]
+                for j in range(i + 1, len(K)):
+                    if self.bracket(bx, B[K[j]]) != zero:
+                        return False
+            return True
 
         def is_solvable(self):
             r"""
@@ -1016,6 +1122,13 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 sage: L.is_solvable() # todo: not implemented - #17416
                 False
             """
+            R = self.base_ring()
+            if (self.dimension() and R.is_field() and R.characteristic() == 0
+                    and not self.killing_form_matrix().is_singular()):
+                # Over a field of characteristic zero a nondegenerate
+                # Killing form means ``self`` is semisimple, hence not
+                # solvable; this avoids building the derived series.
+                return False
             return not self.derived_series()[-1].dimension()
 
         def is_nilpotent(self):
@@ -1031,6 +1144,13 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 sage: L.is_nilpotent()
                 True
             """
+            R = self.base_ring()
+            if R.is_field() and not self.killing_form_matrix().is_zero():
+                # In a nilpotent Lie algebra every ad(x) ad(y) is a
+                # nilpotent operator, so the Killing form vanishes
+                # identically; a nonzero entry rules out nilpotency
+                # without building the lower central series.
+                return False
             return not self.lower_central_series()[-1].dimension()
 
         def is_semisimple(self):
@@ -1047,7 +1167,13 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 sage: L.is_semisimple()
                 False
             """
-            return not self.killing_form_matrix().is_singular()
+            K = self.killing_form_matrix()
+            if self.base_ring().is_field():
+                # A rank computation short-circuits on rank deficiency
+                # and avoids the exact determinant that is_singular
+                # computes, whose intermediate entries can blow up.
+                return K.rank() == K.nrows()
+            return not K.is_singular()
 
         @cached_method(key=lambda self,M,d,s,n: (M,d,s))
         def chevalley_eilenberg_complex(self, M=None, dual=False, sparse=True, ncpus=None):
@@ -1580,10 +1706,22 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 [ 0  0]
             """
             P = self.parent()
-            basis = P.basis()
-            return matrix(self.base_ring(),
-                          [P.bracket(self, b).to_vector(sparse=sparse) for b in basis],
-                          sparse=sparse)
+            if sparse:
+                basis = P.basis()
+                return matrix(self.base_ring(),
+                              [P.bracket(self, b).to_vector(sparse=True)
+                               for b in basis],
+                              sparse=True)
+            # The adjoint action is linear, so the matrix of ``self`` is
+            # the corresponding linear combination of the cached adjoint
+            # matrices of the basis elements.
+            ads = P._basis_adjoint_matrices()
+            index = P._basis_key_inverse
+            d = len(ads)
+            A = matrix(self.base_ring(), d, d)
+            for k, c in self.monomial_coefficients(copy=False).items():
+                A += c * ads[index[k]]
+            return A
 
         def to_vector(self, order=None, sparse=False):
             r"""
@@ -1630,14 +1768,17 @@ class FiniteDimensionalLieAlgebrasWithBasis(CategoryWithAxiom_over_base_ring):
                 from sage.modules.free_module import FreeModule
                 M = FreeModule(self.parent().base_ring(), self.dimension(), sparse=True)
                 if order is None:
-                    order = {b: i for i,b in enumerate(self.parent()._basis_ordering)}
+                    order = self.parent()._basis_key_inverse
                 return M({order[k]: c for k, c in mc.items()})
             else:
-                M = self.parent().module()
-                B = M.basis()
+                P = self.parent()
+                M = P.module()
                 if order is None:
-                    order = self.parent()._basis_ordering
-                return M.sum(mc[k] * B[i] for i, k in enumerate(order) if k in mc)
+                    order = P._basis_ordering
+                zero = P.base_ring().zero()
+                # Build the coordinate list in one pass instead of
+                # summing one module generator per nonzero coefficient.
+                return M([mc.get(k, zero) for k in order])
 
         _vector_ = to_vector
 
@@ -20,7 +20,6 @@ from .category_types import Category_over_base_ring
 from sage.misc.abstract_method import abstract_method
 from sage.categories.modules import Modules
 from sage.structure.element import coerce_binop
-from sage.misc.cachefunc import cached_method
 from sage.categories.commutative_rings import CommutativeRings
 from sage.misc.lazy_import import LazyImport
 _CommutativeRings = CommutativeRings()
@@ -56,7 +55,6 @@ class LambdaBracketAlgebras(Category_over_base_ring):
                     raise ValueError("base must be a commutative ring got {}".format(R))
         return super(LambdaBracketAlgebras, cls).__classcall__(cls, R)
 
-    @cached_method
     def super_categories(self):
         """
         The list of super categories of this category.
@@ -232,7 +230,10 @@ class LambdaBracketAlgebras(Category_over_base_ring):
                 B['K']
             """
             if n >= 0:
-                return self.bracket(rhs).get(n,self.parent().zero())
+                products = self.bracket(rhs)
+                if n in products:
+                    return products[n]
+                return self.parent().zero()
             else:
                 raise NotImplementedError("vertex algebras are not implemented")
 
@@ -27,6 +27,24 @@ from sage.categories.bimodules import Bimodules
 from sage.categories.fields import Fields
 _Fields = Fields()
 
+# Imported lazily to break the import cycle with vector_spaces, while
+# keeping the resolution out of the dispatch hot path below.
+_VectorSpaces = LazyImport('sage.categories.vector_spaces', 'VectorSpaces')
+_ConstantFunction = LazyImport('sage.misc.constant_function', 'ConstantFunction')
+_FilteredModulesCategory = LazyImport('sage.categories.filtered_modules',
+                                      'FilteredModulesCategory')
+_GradedModulesCategory = LazyImport('sage.categories.graded_modules',
+                                    'GradedModulesCategory')
+_SuperModulesCategory = LazyImport('sage.categories.super_modules',
+                                   'SuperModulesCategory')
+
+# Cache for the ``Modules(field)`` -> ``VectorSpaces(field)`` dispatch.
+# Only positive answers are stored: category refinement may discover
+# later on that a ring is a field, but never the converse, so a cached
+# ``VectorSpaces`` result stays valid while a cached negative would not.
+import weakref
+_vector_spaces_dispatch_cache = weakref.WeakValueDictionary()
+
 
 class Modules(Category_module):
     r"""
@@ -148,14 +166,38 @@ class Modules(Category_module):
             sage: TestSuite(C).run()
         """
         if dispatch:
-            if base_ring in _Fields or (isinstance(base_ring, Category)
-                                        and base_ring.is_subcategory(_Fields)):
-                from .vector_spaces import VectorSpaces
-                return VectorSpaces(base_ring, check=False)
+            try:
+                cached = _vector_spaces_dispatch_cache.get(base_ring)
+            except TypeError:
+                cached = None
+            if cached is not None:
+                return cached
+            if isinstance(base_ring, Category):
+                is_field = base_ring.is_subcategory(_Fields)
+            else:
+                # Cheap duck-typed precheck: for the common non-field
+                # rings, is_field(proof=False) answers False without
+                # the category walk done by the membership test, which
+                # remains the final authority on a positive answer.
+                try:
+                    maybe_field = base_ring.is_field(proof=False)
+                except (AttributeError, TypeError, NotImplementedError):
+                    maybe_field = True
+                is_field = maybe_field and base_ring in _Fields
+            if is_field:
+                result = _VectorSpaces(base_ring, check=False)
+                try:
+                    _vector_spaces_dispatch_cache[base_ring] = result
+                except TypeError:
+                    pass
+                return result
         result = super(Modules, cls).__classcall__(cls, base_ring)
-        result._reduction[2]['dispatch'] = False
+        red = result._reduction[2]
+        if 'dispatch' not in red:
+            red['dispatch'] = False
         return result
 
+    @cached_method
     def super_categories(self):
         """
         EXAMPLES::
@@ -251,7 +293,6 @@ class Modules(Category_module):
             """
             return TensorProductsCategory.category_of(self)
 
-        @cached_method
         def DualObjects(self):
             r"""
             Return the category of spaces constructed as duals of
@@ -329,7 +370,6 @@ class Modules(Category_module):
 
         dual = DualObjects
 
-        @cached_method
         def FiniteDimensional(self):
             r"""
             Return the full subcategory of the finite dimensional objects of ``self``.
@@ -384,10 +424,8 @@ class Modules(Category_module):
                 'sage.categories.modules'
             """
             assert base_ring is None or base_ring is self.base_ring()
-            from sage.categories.filtered_modules import FilteredModulesCategory
-            return FilteredModulesCategory.category_of(self)
+            return _FilteredModulesCategory.category_of(self)
 
-        @cached_method
         def Graded(self, base_ring=None):
             r"""
             Return the subcategory of the graded objects of ``self``.
@@ -420,8 +458,7 @@ class Modules(Category_module):
                 'sage.categories.modules'
             """
             assert base_ring is None or base_ring is self.base_ring()
-            from sage.categories.graded_modules import GradedModulesCategory
-            return GradedModulesCategory.category_of(self)
+            return _GradedModulesCategory.category_of(self)
 
         @cached_method
         def Super(self, base_ring=None):
@@ -456,10 +493,8 @@ class Modules(Category_module):
                 'sage.categories.modules'
             """
             assert base_ring is None or base_ring is self.base_ring()
-            from sage.categories.super_modules import SuperModulesCategory
-            return SuperModulesCategory.category_of(self)
+            return _SuperModulesCategory.category_of(self)
 
-        @cached_method
         def WithBasis(self):
             r"""
             Return the full subcategory of the objects of ``self`` with
@@ -484,6 +519,7 @@ class Modules(Category_module):
 
     class FiniteDimensional(CategoryWithAxiom_over_base_ring):
 
+        @cached_method
         def extra_super_categories(self):
             """
             Implement the fact that a finite dimensional module over a finite
@@ -614,6 +650,7 @@ class Modules(Category_module):
         The category of homomorphism sets `\hom(X,Y)` for `X`, `Y` modules.
         """
 
+        @cached_method
         def extra_super_categories(self):
             """
             EXAMPLES::
@@ -623,6 +660,7 @@ class Modules(Category_module):
             """
             return [Modules(self.base_category().base_ring())]
 
+        @cached_method
         def base_ring(self):
             """
             EXAMPLES::
@@ -693,14 +731,23 @@ class Modules(Category_module):
                       From: Free module generated by {1, 2, 3} over Integer Ring
                       To:   Free module generated by {2, 3, 4} over Integer Ring
                 """
-                from sage.misc.constant_function import ConstantFunction
-                return self(ConstantFunction(self.codomain().zero()))
+                codomain = self.codomain()
+                cf = getattr(codomain, '_zero_constant_function', None)
+                if cf is None:
+                    cf = _ConstantFunction(codomain.zero())
+                    try:
+                        codomain._zero_constant_function = cf
+                    except AttributeError:
+                        # some (Cython) parents do not accept new attributes
+                        pass
+                return self(cf)
 
         class Endset(CategoryWithAxiom_over_base_ring):
             """
             The category of endomorphism sets `End(X)` for `X`
             a module (this is not used yet)
             """
+            @cached_method
             def extra_super_categories(self):
                 """
                 Implement the fact that the endomorphism set of a module is an algebra.
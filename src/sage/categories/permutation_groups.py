@@ -8,11 +8,15 @@ Permutation groups
 #                  http://www.gnu.org/licenses/
 #******************************************************************************
 
-from sage.misc.cachefunc import cached_method
 from sage.categories.category import Category
 from sage.categories.groups import Groups
 from sage.misc.lazy_import import LazyImport
 
+# Shared list of super categories; built on first use rather than at
+# import time so that loading this module does not initialize Groups().
+_supers = None
+
+
 class PermutationGroups(Category):
     r"""
     The category of permutation groups.
@@ -46,7 +50,6 @@ class PermutationGroups(Category):
         sage: C = PermutationGroups()
         sage: TestSuite(C).run()
     """
-    @cached_method
     def super_categories(self):
         """
         Return a list of the immediate super categories of ``self``.
@@ -56,6 +59,9 @@ class PermutationGroups(Category):
             sage: PermutationGroups().super_categories()
             [Category of groups]
         """
-        return [Groups()]
+        global _supers
+        if _supers is None:
+            _supers = [Groups()]
+        return _supers
 
     Finite = LazyImport('sage.categories.finite_permutation_groups', 'FinitePermutationGroups')
@@ -94,32 +94,57 @@ class SuperHopfAlgebrasWithBasis(SuperModulesCategory):
 
             S = self.antipode
 
-            IS = lambda x: self.sum(c * self.monomial(t1) * S(self.monomial(t2))
+            # The same basis keys recur across the coproduct terms of
+            # the various test elements; memoize the monomials and
+            # their antipode images by key.
+            mono_cache = {}
+            smono_cache = {}
+
+            def mono(t):
+                try:
+                    return mono_cache[t]
+                except KeyError:
+                    val = mono_cache[t] = self.monomial(t)
+                    return val
+
+            def Smono(t):
+                try:
+                    return smono_cache[t]
+                except KeyError:
+                    val = smono_cache[t] = S(mono(t))
+                    return val
+
+            IS = lambda x: self.sum(c * mono(t1) * Smono(t2)
                                 for ((t1, t2), c) in x.coproduct())
 
-            SI = lambda x: self.sum(c * S(self.monomial(t1)) * self.monomial(t2)
+            SI = lambda x: self.sum(c * Smono(t1) * mono(t2)
                                 for ((t1, t2), c) in x.coproduct())
 
+            # Precompute the homogeneous components and their antipode
+            # images once per element; the pair loop below only needs
+            # the products of the components.
+            elements = []
             for x in tester.some_elements():
                 x_even = x.even_component()
                 x_odd = x.odd_component()
-                for y in tester.some_elements():
-                    y_even = y.even_component()
-                    y_odd = y.odd_component()
+                elements.append((x, x_even, x_odd, S(x_even), S(x_odd)))
 
+            assert_equal = tester.assertEqual
+            for x, x_even, x_odd, Sx_even, Sx_odd in elements:
+                for y, y_even, y_odd, Sy_even, Sy_odd in elements:
                     # The antipode is a graded anti-homomorphism.
-                    tester.assertEqual(S(x_even) * S(y_even),
-                                       S(y_even * x_even))
-                    tester.assertEqual(S(x_even) * S(y_odd),
-                                       S(y_odd * x_even))
-                    tester.assertEqual(S(x_odd) * S(y_even),
-                                       S(y_even * x_odd))
-                    tester.assertEqual(S(x_odd) * S(y_odd),
-                                       -S(y_odd * x_odd))
+                    assert_equal(Sx_even * Sy_even,
+                                 S(y_even * x_even))
+                    assert_equal(Sx_even * Sy_odd,
+                                 S(y_odd * x_even))
+                    assert_equal(Sx_odd * Sy_even,
+                                 S(y_even * x_odd))
+                    assert_equal(Sx_odd * Sy_odd,
+                                 -S(y_odd * x_odd))
 
                 # mu * (S # I) * delta == counit * unit
-                tester.assertEqual(SI(x), self.counit(x) * self.one())
+                assert_equal(SI(x), self.counit(x) * self.one())
 
                 # mu * (I # S) * delta == counit * unit
-                tester.assertEqual(IS(x), self.counit(x) * self.one())
+                assert_equal(IS(x), self.counit(x) * self.one())
 
@@ -25,23 +25,23 @@ This file contains the following elements:
 #                  https://www.gnu.org/licenses/
 # ****************************************************************************
 
-from operator import mul
-from functools import reduce
+from itertools import combinations_with_replacement, product
+from functools import lru_cache
 
 from sage.matrix.constructor import matrix
 from sage.arith.misc import binomial
 from sage.coding.linear_code import AbstractLinearCode, LinearCodeSyndromeDecoder
 from sage.coding.encoder import Encoder
-from sage.combinat.subset import Subsets
 from sage.combinat.tuple import Tuples
 from sage.categories.finite_fields import FiniteFields
 from sage.rings.finite_rings.finite_field_constructor import GF
 from sage.rings.integer import Integer
 from sage.modules.free_module_element import vector
 from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
-from sage.misc.cachefunc import cached_method
+from sage.misc.cachefunc import cached_function, cached_method
 
 
+@lru_cache(maxsize=None)
 def _binomial_sum(n, k):
     r"""
     Returns the sum of all binomials `\binom{n}{i}`,
@@ -57,6 +57,8 @@ def _binomial_sum(n, k):
         sage: _binomial_sum(4, 2)
         11
     """
+    n = int(n)
+    k = int(k)
     s = 1
     nCi = 1
     for i in range(k):
@@ -97,39 +99,112 @@ def _multivariate_polynomial_interpolation(evaluation, order, polynomial_ring):
 
     If there does not exist
     """
+    base_field = polynomial_ring.base_ring()
+    base_field_list = base_field.list()
+    q = base_field.cardinality()
+    gens = polynomial_ring.gens()
+
     def _interpolate(evaluation, num_of_var, order):
         if num_of_var == 0 or order == 0:
             return evaluation[0]
-        base_field = polynomial_ring.base_ring()
-        q = base_field.cardinality()
         n_by_q = q**(num_of_var - 1)
         d = min(order + 1, q)
-        multipoint_evaluation_list = []
-        uni_poly_ring = PolynomialRing(base_field, 'x')
-        base_field_zero = base_field.zero()
-        for k in range(n_by_q):
-            iterator = iter(base_field)
-            points = []
-            for i in range(d):
-                xcoordinate = next(iterator)
-                points.append((xcoordinate, evaluation[k + i * n_by_q]))
-            polyVector = uni_poly_ring.lagrange_polynomial(
-                points).coefficients(sparse=False)
-            if len(polyVector) < d:
-                # adding zeros to represent a (d-1) degree polynomial
-                polyVector += [base_field_zero] * (d - len(polyVector))
-            multipoint_evaluation_list.append(polyVector)
+        # Every stripe interpolates on the same d points, so instead of
+        # one Lagrange interpolation per stripe we solve all of them at
+        # once: stacking the stripe evaluations into the rows of Y, the
+        # coefficient vectors are the rows of Y * (V^-1)^T where V is
+        # the Vandermonde matrix of the points.
+        points = base_field_list[:d]
+        vandermonde = matrix(base_field, d, d,
+                             lambda i, j: points[i] ** j)
+        evals = matrix(base_field, n_by_q, d,
+                       [[evaluation[k + i * n_by_q] for i in range(d)]
+                        for k in range(n_by_q)])
+        multipoint_evaluation_list = (evals
+                                      * vandermonde.inverse().transpose()).rows()
         poly = polynomial_ring.zero()
         z = 1
-        x = polynomial_ring.gen(num_of_var - 1)
+        x = gens[num_of_var - 1]
         for k in range(d):  # computing the polynomial
+            if k:
+                z *= x
             poly = poly + z * _interpolate([multipoint_evaluation_list[i][k]
                                             for i in range(n_by_q)], num_of_var - 1, order - k)
-            z *= x
         return poly
     return _interpolate(evaluation, polynomial_ring.ngens(), order)
 
 
+@cached_function
+def _generator_matrix(base_field, order, num_of_var):
+    r"""
+    Return the generator matrix of the Reed-Muller code with the given
+    parameters, with rows in the monomial order used by
+    :class:`ReedMullerVectorEncoder`.
+
+    The result is cached, so all encoders for codes with the same
+    parameters share one immutable matrix.
+
+    INPUT:
+
+    - ``base_field`` -- the finite field over which the code is built
+
+    - ``order`` -- the order of the Reed-Muller code
+
+    - ``num_of_var`` -- the number of variables
+
+    EXAMPLES::
+
+        sage: from sage.coding.reed_muller_code import _generator_matrix
+        sage: _generator_matrix(GF(2), 1, 2)
+        [1 1 1 1]
+        [0 1 0 1]
+        [0 0 1 1]
+    """
+    q = base_field.cardinality()
+    # The evaluation points in the order documented by
+    # :meth:`ReedMullerVectorEncoder.points` (first coordinate varying
+    # fastest), without materializing the ambient vector space.
+    field_list = base_field.list()
+    points = [p[::-1] for p in product(field_list, repeat=num_of_var)]
+    max_individual_degree = min(order, (q - 1))
+    # Power table over the point grid: powers[j][e] lists p[j]**e
+    # for all points p, so each matrix row is a pointwise product
+    # of at most ``order`` precomputed columns.
+    one_row = [base_field.one()] * len(points)
+    powers = []
+    for j in range(num_of_var):
+        coordinate = [p[j] for p in points]
+        table = [one_row, coordinate]
+        for e in range(2, max_individual_degree + 1):
+            table.append([a * b for a, b in zip(table[-1], coordinate)])
+        powers.append(table)
+    # Enumerate the monomials of each degree directly as sorted
+    # multisets of variable indices; this walks them in the same
+    # order as the former submultiset enumeration, without building
+    # a combinat object per degree.
+    matrix_list = []
+    for degree in range(order + 1):
+        for monomial in combinations_with_replacement(range(num_of_var),
+                                                      degree):
+            exponent = [0] * num_of_var
+            for i in monomial:
+                exponent[i] += 1
+            if (degree > max_individual_degree
+                    and max(exponent) > max_individual_degree):
+                continue
+            row = None
+            for j in range(num_of_var):
+                e = exponent[j]
+                if e:
+                    column = powers[j][e]
+                    row = (column if row is None else
+                           [a * b for a, b in zip(row, column)])
+            matrix_list.append(row if row is not None else one_row)
+    M = matrix(base_field, matrix_list)
+    M.set_immutable()
+    return M
+
+
 def ReedMullerCode(base_field, order, num_of_var):
     r"""
     Returns a Reed-Muller code.
@@ -298,6 +373,7 @@ class QAryReedMullerCode(AbstractLinearCode):
         """
         return self._num_of_var
 
+    @cached_method
     def minimum_distance(self):
         r"""
         Returns the minimum distance between two words in ``self``.
@@ -360,6 +436,8 @@ class QAryReedMullerCode(AbstractLinearCode):
             sage: C1.__eq__(C2)
             True
         """
+        if self is other:
+            return True
         # I am not comparing the base field directly because of possible change
         # in variables
         return isinstance(other, QAryReedMullerCode) \
@@ -367,6 +445,20 @@ class QAryReedMullerCode(AbstractLinearCode):
             and self.order() == other.order() \
             and self.number_of_variables() == other.number_of_variables()
 
+    def __hash__(self):
+        r"""
+        Returns a hash of ``self``.
+
+        EXAMPLES::
+
+            sage: from sage.coding.reed_muller_code import QAryReedMullerCode
+            sage: C1 = QAryReedMullerCode(GF(59), 2, 4)
+            sage: C2 = QAryReedMullerCode(GF(59), 2, 4)
+            sage: hash(C1) == hash(C2)
+            True
+        """
+        return hash((self.base_field(), self._order, self._num_of_var))
+
 
 class BinaryReedMullerCode(AbstractLinearCode):
     r"""
@@ -458,6 +550,7 @@ class BinaryReedMullerCode(AbstractLinearCode):
         """
         return self._num_of_var
 
+    @cached_method
     def minimum_distance(self):
         r"""
         Returns the minimum distance of ``self``.
@@ -469,7 +562,7 @@ class BinaryReedMullerCode(AbstractLinearCode):
             sage: C.minimum_distance()
             4
         """
-        return 2**(self.number_of_variables() - self.order())
+        return Integer(1) << (self._num_of_var - self._order)
 
     def _repr_(self):
         r"""
@@ -508,10 +601,25 @@ class BinaryReedMullerCode(AbstractLinearCode):
             sage: C1.__eq__(C2)
             True
         """
+        if self is other:
+            return True
         return isinstance(other, BinaryReedMullerCode) \
             and self.order() == other.order() \
             and self.number_of_variables() == other.number_of_variables()
 
+    def __hash__(self):
+        r"""
+        Returns a hash of ``self``.
+
+        EXAMPLES::
+
+            sage: C1 = codes.BinaryReedMullerCode(2, 4)
+            sage: C2 = codes.BinaryReedMullerCode(2, 4)
+            sage: hash(C1) == hash(C2)
+            True
+        """
+        return hash((self._order, self._num_of_var))
+
 
 class ReedMullerVectorEncoder(Encoder):
     r"""
@@ -645,21 +753,8 @@ class ReedMullerVectorEncoder(Encoder):
             [0 0 0 1 1 1 1 1 1]
         """
         C = self.code()
-        base_field = C.base_field()
-        order = C.order()
-        num_of_var = C.number_of_variables()
-        q = base_field.cardinality()
-        points = base_field**num_of_var
-        matrix_list = []
-        max_individual_degree = min(order, (q - 1))
-        for degree in range(order + 1):
-            exponents = Subsets(list(range(num_of_var)) * max_individual_degree,
-                                degree, submultiset=True)
-            matrix_list += [[reduce(mul, [x[i] for i in exponent], 1)
-                             for x in points] for exponent in exponents]
-        M = matrix(base_field, matrix_list)
-        M.set_immutable()
-        return M
+        return _generator_matrix(C.base_field(), C.order(),
+                                 C.number_of_variables())
 
     def points(self):
         r"""
@@ -1881,10 +1881,11 @@ class Compositions_all(Compositions):
             sage: [next(it) for i in range(10)]
             [[], [1], [1, 1], [2], [1, 1, 1], [1, 2], [2, 1], [3], [1, 1, 1, 1], [1, 1, 2]]
         """
+        element_class = self.element_class
         n = 0
         while True:
             for c in Compositions(n):
-                yield self.element_class(self, list(c))
+                yield element_class(self, list(c))
             n += 1
 
 
@@ -1959,7 +1960,7 @@ class Compositions_n(Compositions):
             1
         """
         if self.n >= 1:
-            return ZZ(2)**(self.n - 1)
+            return ZZ.one() << (self.n - 1)
         elif self.n == 0:
             return ZZ.one()
         else:
@@ -2003,8 +2004,9 @@ class Compositions_n(Compositions):
             sage: Compositions(0).list()
             [[]]
         """
+        element_class = self.element_class
         for c in composition_iterator_fast(self.n):
-            yield self.element_class(self, c)
+            yield element_class(self, c)
 
 
 def composition_iterator_fast(n):